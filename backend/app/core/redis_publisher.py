@@ -1,8 +1,8 @@
-import json
 import logging
 from typing import Dict
 
 import redis
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -22,14 +22,14 @@ class RedisPublisher:
             # Creating a channel name for this specific match
             channel = f"match: {match_id}"
 
-            # Converting the match data to JSON string
-            message = json.dumps(match_data)
+            # Serializing the match data straight to JSON bytes
+            message = orjson.dumps(match_data)
 
             # Publishing the message to the Redis channel
             self.redis_client.publish(channel=channel, message=message)
 
             # Logging the successful publishing of the message
-            logger.info(f"Published the update to the channel")
+            logger.debug("Published the update to %s", channel)
 
         except Exception as e:
             # Exception Handling block
@@ -52,8 +52,8 @@ class RedisPublisher:
                 "data": data
             }
 
-            # Converting to the JSON string
-            message = json.dumps(message_data)
+            # Serializing straight to JSON bytes
+            message = orjson.dumps(message_data)
 
             # Publishing the message to Redis
             self.redis_client.publish(channel, message)
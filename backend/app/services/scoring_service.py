@@ -34,9 +34,8 @@ class ScoringService:
             # Adding the new Match object to the session
             self.session.add(new_match)
 
-            # Commit and refresh
+            # Committing, the primary key is already populated by the flush
             self.session.commit()
-            self.session.refresh(new_match)
 
             return new_match
 
@@ -331,7 +330,7 @@ class ScoringService:
                 
                 # Publishing to Redis
                 publisher.publish_match_update(match_id, update_data)
-                logger.info(f"Published score update for match {match_id} to Redis")
+                logger.debug("Published score update for match %s to Redis", match_id)
                 
             except Exception as e:
                 # Logging but not failing the request if Redis publish fails
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Dict, List
 
@@ -93,34 +94,37 @@ class ConnectionManager:
 
             # Checking if there are any connections for this channel
             if channel not in self.active_connections:
-                logger.debug(f"No active connections for {channel}")
+                logger.debug("No active connections for %s", channel)
                 return
             
             # Getting the list of connections by creating a shallow copy to avoid modification during iteration
             connections = self.active_connections[channel].copy()
 
+            # Broadcasting to all connections concurrently so one slow client doesn't delay the rest
+            results = await asyncio.gather(
+                *(websocket.send_text(message) for websocket in connections),
+                return_exceptions=True
+            )
+
             # Counting successful sends
             successful_sends = 0
             failed_connections = []
 
-            # Broadcasting to all connections
-            for websocket in connections:
-                try:
-                    # Sending the message
-                    await websocket.send_text(message)
-                    successful_sends = successful_sends + 1
-                    
-                except Exception as e:
+            for websocket, result in zip(connections, results):
+                # CancelledError is a BaseException, so checking Exception alone would count it as a successful send
+                if isinstance(result, BaseException):
                     # Logging failed send but continuing with others
-                    logger.warning(f"Failed to send to a client on {channel}: {e}")
+                    logger.warning(f"Failed to send to a client on {channel}: {result}")
                     failed_connections.append(websocket)
+                else:
+                    successful_sends = successful_sends + 1
 
             # Removing failed connections
             for websocket in failed_connections:
                 await self.disconnect(websocket, match_id)
 
             # Logging the broadcast
-            logger.info(f"Broadcast to {successful_sends}/{len(connections)} clients on {channel}")
+            logger.debug("Broadcast to %s/%s clients on %s", successful_sends, len(connections), channel)
 
         except Exception as e:
             # Error Handling Block
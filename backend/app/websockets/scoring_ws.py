@@ -1,14 +1,35 @@
-import json
 import logging
 import asyncio
+from typing import Dict
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
-from app.core.database import get_db, get_async_redis
+from app.core.database import read_session_scope, get_async_redis
 from app.services.scoring_service import ScoringService
 from app.websockets.connection_manager import ConnectionManager
 
 logger = logging.getLogger(__name__)
 
+def load_initial_data(match_id: int) -> Dict | None:
+    """Loading the initial match payload for a newly connected client"""
+    with read_session_scope() as db:
+        service = ScoringService(db)
+        match = service.get_match(match_id)
+
+        if match is None:
+            return None
+
+        # Creating initial data payload
+        return {
+            "type": "initial",
+            "match_id": match.id,
+            "tournament_id": match.tournament_id,
+            "team1_id": match.team1_id,
+            "team2_id": match.team2_id,
+            "status": match.status.value,
+            "score_data": match.score_data
+        }
+
 async def handle_websocket_connection(
     websocket: WebSocket,
     match_id: int,
@@ -19,25 +40,12 @@ async def handle_websocket_connection(
     await manager.connect(websocket, match_id)
 
     try:
-        # Sending the initial match data to the client
-        db = next(get_db())
-        service = ScoringService(db)
-        match = service.get_match(match_id)
-
-        if match:
-            # Creating initial data payload
-            initial_data = {
-                "type": "initial",
-                "match_id": match.id,
-                "tournament_id": match.tournament_id,
-                "team1_id": match.team1_id,
-                "team2_id": match.team2_id,
-                "status": match.status.value,
-                "score_data": match.score_data
-            }
+        # Loading the initial match data in a worker thread so the blocking query doesn't stall the event loop
+        initial_data = await asyncio.to_thread(load_initial_data, match_id)
 
+        if initial_data:
             # Sending initial data
-            await websocket.send_text(json.dumps(initial_data))
+            await websocket.send_text(orjson.dumps(initial_data).decode())
             logger.info(f"Sent initial data to client for match {match_id}")
 
         # Starting heartbeat task
@@ -55,16 +63,16 @@ async def handle_websocket_connection(
                 # Handling different message types
                 if data == "pong":
                     # Client responded to ping - connection is alive
-                    logger.debug(f"Received pong from match {match_id}")
+                    logger.debug("Received pong from match %s", match_id)
                     
                 elif data == "ping":
                     # Client sent ping - respond with pong
                     await websocket.send_text("pong")
-                    logger.debug(f"Responded to ping for match {match_id}")
+                    logger.debug("Responded to ping for match %s", match_id)
                     
                 else:
                     # Handling other messages if needed
-                    logger.debug(f"Received message from match {match_id}: {data}")
+                    logger.debug("Received message from match %s: %s", match_id, data)
                     
             except asyncio.TimeoutError:
                 # No message in 60 seconds - connection might be stale
@@ -93,7 +101,7 @@ async def send_heartbeat(websocket: WebSocket, match_id: int) -> None:
             try:
                 # Sending ping to client
                 await websocket.send_text("ping")
-                logger.debug(f"Sent ping to client for match {match_id}")
+                logger.debug("Sent ping to client for match %s", match_id)
 
             except Exception as e:
                 # Failed to send meaning connection is broken
@@ -102,7 +110,7 @@ async def send_heartbeat(websocket: WebSocket, match_id: int) -> None:
                 
     except asyncio.CancelledError:
         # Task was cancelled meaning its a normal shutdown
-        logger.debug(f"Heartbeat task cancelled for match {match_id}")
+        logger.debug("Heartbeat task cancelled for match %s", match_id)
 
 async def redis_subscriber(manager: ConnectionManager) -> None:
     """Background function that listens to Redis pub/sub and forwards updates to WebSocket clients"""
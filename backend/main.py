@@ -1,17 +1,19 @@
+import os
+import time
 import asyncio
 from typing import List
 from sqlalchemy.orm import Session
 from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from fastapi.responses import JSONResponse
 from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi import FastAPI, HTTPException, Depends, Request
 
-from app.core.database import get_redis
 from app.core.middleware import log_requests
 from app.core.logging_config import setup_logging
-from app.core.database import SessionLocal, get_db
+from app.core.database import get_db, get_read_db, ping_database, redis_healthy, HEALTH_TIMEOUT, redis_ping_loop, warmup_pool
 from app.services.scoring_service import ScoringService
 from app.models.match import Match, Tournament, Team, User
 from app.websockets.connection_manager import ConnectionManager
@@ -44,10 +46,17 @@ async def lifespan(app: FastAPI):
     # On Startup: this runs before app starts accepting requests
     logger.info("PitchPulse API starting up...")
     logger.info("Database connection initializing...")
+    await asyncio.to_thread(warmup_pool)
     logger.info("Redis connection initializing...")
 
     redis_task = asyncio.create_task(redis_subscriber(manager))
     logger.info("Redis subscriber started")
+
+    redis_ping_task = asyncio.create_task(redis_ping_loop())
+    logger.info("Redis health monitor started")
+
+    # Small dedicated executor so probes stuck on a slow database can't starve the default to_thread pool
+    app.state.health_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="health")
     
     logger.info("API ready to accept requests")
     
@@ -55,6 +64,8 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     redis_task.cancel()
+    redis_ping_task.cancel()
+    app.state.health_executor.shutdown(wait=False)
     logger.info("PitchPulse API shutting down...")
 
 # Initializing the app object
@@ -108,6 +119,10 @@ def get_scoring_service(db: Session = Depends(get_db)) -> ScoringService:
     # Simply returns a scoring service object
     return ScoringService(db)
 
+def get_read_scoring_service(db: Session = Depends(get_read_db)) -> ScoringService:
+    """Dependency Injection function for the scoring service on read-only endpoints"""
+    return ScoringService(db)
+
 # WebSocket endpoint
 @app.websocket("/ws/matches/{match_id}")
 async def websocket_route(websocket: WebSocket, match_id: int):
@@ -135,6 +150,8 @@ def create_user(
         # Adding the user to the database
         db.add(user)
         db.commit()
+
+        # Reloading so created_at is returned as Postgres stored it in the tz-naive TIMESTAMP column
         db.refresh(user)
 
         # Returning the user object
@@ -162,7 +179,6 @@ def create_tournament(
         # Adding the tournament to the database
         db.add(tournament)
         db.commit()
-        db.refresh(tournament)
         
         # Returning the tournament object
         return tournament
@@ -188,7 +204,6 @@ def create_team(
         # Adding the team to the database
         db.add(team)
         db.commit()
-        db.refresh(team)
 
         # Returning the team object
         return team
@@ -230,7 +245,7 @@ def create_match(
 @app.get("/matches/{match_id}", response_model=MatchResponse, status_code=200)
 def get_match(
     match_id: int,
-    service: ScoringService = Depends(get_scoring_service)
+    service: ScoringService = Depends(get_read_scoring_service)
 ) -> Match:
     """Endpoint to get a match by ID"""
     try:
@@ -317,7 +332,7 @@ def process_ball(
 @app.get("/tournaments/{tournament_id}/matches", response_model=List[MatchResponse], status_code=200)
 def get_tournament_matches(
     tournament_id: int,
-    service: ScoringService = Depends(get_scoring_service)
+    service: ScoringService = Depends(get_read_scoring_service)
 ) -> List[Match]:
     """Endpoint to get all matches for a tournament"""
     try:
@@ -356,29 +371,86 @@ def complete_match(
         # Exception Handling Block
         raise HTTPException(status_code=500, detail=f"Failed to complete match: {str(e)}")
 
-@app.get("/health", status_code=200)
-def health_check(db: Session = Depends(get_db)):
-    """Health check endpoint to verify API and database connectivity"""
+# Short-lived cache of the /health payload so probe storms don't reach Postgres and Redis
+HEALTH_CACHE_TTL = float(os.getenv("HEALTH_CACHE_TTL", "2"))
+_health_cache = {"expires": 0.0, "status_code": 200, "payload": None}
+
+# Probe currently refreshing the cache, concurrent requests await it instead of queueing their own
+_health_refresh: asyncio.Task | None = None
+
+async def _check_db() -> str:
+    """Pings the database in a worker thread within the health deadline"""
     try:
-        # Test database connection
-        db.execute("SELECT 1")
-        
-        # Test Redis connection
-        redis_client = get_redis()
-        redis_client.ping()
-        
-        return {
-            "status": "healthy",
-            "version": "1.0.0",
-            "database": "connected",
-            "redis": "connected"
-        }
-    
-    except Exception as e:
-        raise HTTPException(
-            status_code=503,
-            detail=f"Service unhealthy: {str(e)}"
+        # Falling back to the default executor when the app runs without its lifespan
+        executor = getattr(app.state, "health_executor", None)
+        loop = asyncio.get_running_loop()
+        db_ok = await asyncio.wait_for(
+            loop.run_in_executor(executor, ping_database),
+            timeout=HEALTH_TIMEOUT
         )
+        return "connected" if db_ok else "disconnected"
+
+    except asyncio.TimeoutError:
+        # Treating a probe that misses the deadline as unhealthy
+        logger.warning(f"Database health check timed out after {HEALTH_TIMEOUT}s")
+        return "timeout"
+
+async def _check_redis() -> str:
+    """Reads the Redis liveness flag maintained by the background ping task"""
+    return "connected" if redis_healthy() else "disconnected"
+
+@app.get("/health/live", status_code=200)
+async def liveness_check():
+    """Liveness endpoint confirming the process is serving requests, never touches any dependency"""
+    return {"status": "ok"}
+
+async def _refresh_health() -> tuple[int, dict]:
+    """Probes every dependency once and stores the result in the health cache"""
+    # Running both probes before deciding so one response reports every dependency
+    db_status, redis_status = await asyncio.gather(_check_db(), _check_redis())
+
+    # The API can't serve requests without the database, losing Redis only stops live updates
+    if db_status != "connected":
+        status = "unhealthy"
+    elif redis_status != "connected":
+        status = "degraded"
+    else:
+        status = "healthy"
+
+    payload = {
+        "status": status,
+        "version": "1.0.0",
+        "database": db_status,
+        "redis": redis_status,
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
+    status_code = 503 if status == "unhealthy" else 200
+
+    # Only caching probes that actually completed, never a timeout
+    if db_status != "timeout":
+        _health_cache["payload"] = payload
+        _health_cache["status_code"] = status_code
+        _health_cache["expires"] = time.monotonic() + HEALTH_CACHE_TTL
+
+    return status_code, payload
+
+@app.get("/health/ready", status_code=200)
+@app.get("/health", status_code=200)
+async def health_check() -> JSONResponse:
+    """Health check endpoint reporting the status of every dependency, 503 only when the database is down"""
+    global _health_refresh
+
+    # Serving a recent result without touching the backends
+    if time.monotonic() < _health_cache["expires"]:
+        return JSONResponse(status_code=_health_cache["status_code"], content=_health_cache["payload"])
+
+    # Joining the in-flight probe so piled up requests all answer within one HEALTH_TIMEOUT
+    if _health_refresh is None or _health_refresh.done():
+        _health_refresh = asyncio.create_task(_refresh_health())
+
+    # Shielding so a disconnecting client doesn't cancel the probe the other waiters share
+    status_code, payload = await asyncio.shield(_health_refresh)
+    return JSONResponse(status_code=status_code, content=payload)
     
 if __name__ == "__main__":
     import uvicorn
@@ -12,6 +12,7 @@ setup(
         "sqlalchemy",
         "psycopg2-binary",
         "redis",
+        "orjson",
         "python-dotenv",
         "alembic",
     ],
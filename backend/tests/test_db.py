@@ -3,9 +3,12 @@
 import sys
 from pathlib import Path
 
-from app.core.database import engine, redis_db, get_db, get_redis
+from app.core.database import engine, redis_client, get_db, get_redis
 from sqlalchemy import text
 
+# Redis keys written by this script, removed together with a single DEL at the end
+TEST_KEYS = ("raw_test", "dep_test")
+
 print("=== Testing Raw Connections ===")
 
 print("\n1. Testing PostgreSQL engine directly...")
@@ -14,8 +17,9 @@ with engine.connect() as conn:
     print(f"   Raw engine result: {result.fetchone()}")
 
 print("\n2. Testing Redis client directly...")
-redis_db.set('raw_test', 'direct')
-print(f"   Raw redis result: {redis_db.get('raw_test')}")
+# Pipelining the write and read-back so they share one round trip
+_, raw_result = redis_client.pipeline(transaction=False).set('raw_test', 'direct').get('raw_test').execute()
+print(f"   Raw redis result: {raw_result}")
 
 print("\n=== Testing Dependency Functions ===")
 
@@ -33,7 +37,10 @@ finally:
  
 print("\n4. Testing get_redis() dependency...")
 redis_client = get_redis()
-redis_client.set('dep_test', 'from_function')
-print(f"   get_redis() result: {redis_client.get('dep_test')}")
+_, dep_result = redis_client.pipeline(transaction=False).set('dep_test', 'from_function').get('dep_test').execute()
+print(f"   get_redis() result: {dep_result}")
+
+print("\n5. Cleaning up test keys...")
+redis_client.delete(*TEST_KEYS)
 
 print("\nAll tests passed!")
\ No newline at end of file
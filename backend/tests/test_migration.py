@@ -7,7 +7,7 @@ sys.path.insert(0, str(backend_dir))
 
 from app.core.database import engine, SessionLocal
 from app.models.match import User, Tournament, Team, Match, MatchStatus
-from sqlalchemy import text
+from sqlalchemy import delete, text
 from datetime import datetime
 
 print("=" * 60)
@@ -185,11 +185,11 @@ try:
     # ========================================
     print("\n=== Part 5: Cleaning Up Test Data ===\n")
     
-    session.delete(match)
-    session.delete(team1)
-    session.delete(team2)
-    session.delete(tournament)
-    session.delete(user)
+    # Bulk deletes in FK order so the ORM doesn't load each object's relationships first
+    session.execute(delete(Match).where(Match.tournament_id == tournament.id))
+    session.execute(delete(Team).where(Team.tournament_id == tournament.id))
+    session.execute(delete(Tournament).where(Tournament.id == tournament.id))
+    session.execute(delete(User).where(User.id == user.id))
     session.commit()
     
     print("   [PASS] All test data cleaned up")
@@ -11,6 +11,7 @@ from app.core.database import SessionLocal
 from app.models.match import User, Tournament, Team, Match, MatchStatus
 from app.services.scoring_service import ScoringService
 from datetime import datetime, timezone
+from sqlalchemy import delete
 
 print("=" * 60)
 print("SCORING SERVICE TEST")
@@ -277,12 +278,11 @@ try:
     # ========================================
     print("\n=== Cleanup ===\n")
     
-    session.delete(match)
-    session.delete(match2)
-    session.delete(team1)
-    session.delete(team2)
-    session.delete(tournament)
-    session.delete(user)
+    # Bulk deletes in FK order so the ORM doesn't load each object's relationships first
+    session.execute(delete(Match).where(Match.tournament_id == tournament.id))
+    session.execute(delete(Team).where(Team.tournament_id == tournament.id))
+    session.execute(delete(Tournament).where(Tournament.id == tournament.id))
+    session.execute(delete(User).where(User.id == user.id))
     session.commit()
     
     print("[PASS] All test data cleaned up")